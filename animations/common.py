@@ -3,14 +3,251 @@ Common utilities and constants for Bitcoin visualization animations.
 Synthwave/Cyberpunk color palette and shared helper functions.
 """
 
+import functools
+import os
+
 from manim import *
 import numpy as np
 
-# Synthwave Color Palette
-SYNTH_BG = "#000221"
-SYNTH_GREEN = "#20E516"
-SYNTH_CYAN = "#00A0D0"
-SYNTH_ORANGE = "#FF6C11"
-SYNTH_PURPLE = "#261447"
-SYNTH_PEACH = "#FF8664"
-SYNTH_GOLD = "#FFD700"
+# Draft-quality guard: set VIZ_DRAFT=1 to halve the render resolution and
+# drop the frame rate on top of whatever -q flag manim was given.
+# Rasterization dominates render time for these scenes, so this roughly
+# quarters pixel-fill work during dev iteration. Values above 2 divide
+# the resolution further (VIZ_DRAFT=4 quarters each dimension) and drop
+# the frame rate to 15 for the fastest possible preview loop.
+_draft = os.getenv("VIZ_DRAFT")
+if _draft:
+    _divisor = max(int(_draft), 2) if _draft.isdigit() else 2
+    config.pixel_width //= _divisor
+    config.pixel_height //= _divisor
+    config.frame_rate = 24 if _divisor == 2 else 15
+del _draft
+
+# VIZ_FAST=1 compresses dramatic pauses and lets scenes skip purely
+# decorative beats (pulses, glows), so a dev render spends its frames
+# on the motion actually being iterated on. Scenes multiply their wait
+# durations by WAIT_SCALE.
+VIZ_FAST = bool(os.getenv("VIZ_FAST"))
+WAIT_SCALE = 0.1 if VIZ_FAST else 1.0
+
+# Synthwave Color Palette, parsed into ManimColor once at import.
+# Passing the raw hex strings around means every set_color/set_fill call
+# re-parses them; ManimColor instances pass straight through.
+SYNTH_BG = ManimColor("#000221")
+SYNTH_GREEN = ManimColor("#20E516")
+SYNTH_CYAN = ManimColor("#00A0D0")
+SYNTH_ORANGE = ManimColor("#FF6C11")
+SYNTH_PURPLE = ManimColor("#261447")
+SYNTH_PEACH = ManimColor("#FF8664")
+SYNTH_GOLD = ManimColor("#FFD700")
+
+# Precomputed layout anchors for the fixed camera frame. Equivalent to
+# the to_edge placements used throughout the scenes (title at the top
+# edge, caption half a unit above the bottom edge), but resolved once at
+# import instead of re-querying frame size and bounding boxes per call.
+TITLE_POS = UP * (config.frame_y_radius - 0.85)
+CAPTION_POS = DOWN * (config.frame_y_radius - 1.2)
+
+
+@functools.lru_cache(maxsize=512)
+def _text_prototype(text, font_size, color, weight, font):
+    """Build and cache a Text prototype for a (content, style) combination."""
+    kwargs = {"font_size": font_size, "color": color}
+    if weight is not None:
+        kwargs["weight"] = weight
+    if font is not None:
+        kwargs["font"] = font
+    return Text(text, **kwargs)
+
+
+def styled_text(text, font_size=24, color=WHITE, weight=None, font=None):
+    """Create a Text mobject, reusing a cached prototype per (text, style).
+
+    Text construction triggers Pango shaping and SVG parsing each time,
+    which dominates scene build cost for repeated identical labels.
+    Callers always receive a fresh copy so the cached prototype is never
+    mutated by scene animations.
+    """
+    return _text_prototype(text, font_size, color, weight, font).copy()
+
+
+def title_text(text, color=SYNTH_CYAN, weight=None):
+    """Scene title label in the shared style (font_size=38)."""
+    return styled_text(text, font_size=38, color=color, weight=weight)
+
+
+def body_text(text, color=SYNTH_GREEN, weight=None):
+    """Caption/explanation label in the shared style (font_size=22)."""
+    return styled_text(text, font_size=22, color=color, weight=weight)
+
+
+# Hexagon prototypes shared across scenes. RegularPolygon recomputes its
+# vertex Beziers on every construction; .copy() just duplicates the
+# finished point arrays.
+_MINER_HEX_PROTO = RegularPolygon(n=6, radius=2, color=SYNTH_CYAN, stroke_width=4)
+_MINER_HEX_PROTO.set_fill(color=SYNTH_CYAN, opacity=0.1)
+
+_CORONA_HEX_PROTO = RegularPolygon(
+    n=6, radius=2.3, color=SYNTH_ORANGE, stroke_width=2, stroke_opacity=0.6
+)
+
+_TX_HEX_PROTO = RegularPolygon(n=6, radius=0.25, color=SYNTH_PEACH, stroke_width=2)
+_TX_HEX_PROTO.set_fill(color=SYNTH_PEACH, opacity=0.2)
+
+_COINBASE_HEX_PROTO = RegularPolygon(n=6, radius=0.35, color=SYNTH_GOLD, stroke_width=3)
+_COINBASE_HEX_PROTO.set_fill(color=SYNTH_GOLD, opacity=0.3)
+
+
+def miner_hex():
+    """Large cyan miner node hexagon, copied from a shared prototype."""
+    return _MINER_HEX_PROTO.copy()
+
+
+def corona_hex():
+    """Orange corona outline matching the miner hexagon."""
+    return _CORONA_HEX_PROTO.copy()
+
+
+def tx_hex():
+    """Small peach transaction hexagon, copied from a shared prototype."""
+    return _TX_HEX_PROTO.copy()
+
+
+def coinbase_hex():
+    """Gold coinbase transaction hexagon, copied from a shared prototype."""
+    return _COINBASE_HEX_PROTO.copy()
+
+
+@functools.lru_cache(maxsize=32)
+def _rounded_rect_prototype(width, height, corner_radius):
+    """Build and cache bare rounded-rectangle geometry per size."""
+    return RoundedRectangle(width=width, height=height, corner_radius=corner_radius)
+
+
+def rounded_rect(width, height, corner_radius=0.15, color=WHITE,
+                 fill_opacity=0.0, stroke_width=4):
+    """Create a styled RoundedRectangle from cached geometry.
+
+    Corner tessellation is the expensive part of RoundedRectangle
+    construction; prototypes are cached per exact size (rather than
+    stretching one unit prototype, which would flatten the corner arcs
+    into ellipses) and copies only restyle the finished point arrays.
+    """
+    rect = _rounded_rect_prototype(width, height, corner_radius).copy()
+    rect.set_stroke(color=color, width=stroke_width)
+    rect.set_fill(color=color, opacity=fill_opacity)
+    return rect
+
+
+def rasterized_image(mobject, cache_name, deps=()):
+    """Render a static mobject once to a cached PNG and return it as an
+    ImageMobject.
+
+    Cairo re-strokes every visible vector path on every frame, so a
+    decoration that never changes (like the background grid) pays its
+    full tessellation cost for the whole time it is on screen. Blitting
+    a pre-rendered image is one copy per frame instead. The cache lives
+    under media/ (git-ignored); the filename carries the render
+    resolution so draft and full-quality runs never share a PNG, and
+    the image is regenerated whenever this module — or any path in
+    ``deps``, typically the caller's ``__file__`` — is newer than it.
+    """
+    cache_dir = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        "media", "raster_cache"
+    )
+    stem, ext = os.path.splitext(cache_name)
+    path = os.path.join(
+        cache_dir,
+        f"{stem}_{config.pixel_width}x{config.pixel_height}{ext or '.png'}"
+    )
+    stamp = max(
+        os.path.getmtime(dep)
+        for dep in (os.path.abspath(__file__), *deps)
+    )
+    if not os.path.exists(path) or os.path.getmtime(path) < stamp:
+        from PIL import Image
+
+        os.makedirs(cache_dir, exist_ok=True)
+        camera = Camera(background_opacity=0.0)
+        camera.reset()
+        camera.capture_mobjects([mobject])
+        Image.fromarray(camera.pixel_array).save(path)
+    image = ImageMobject(path)
+    image.height = config.frame_height
+    return image
+
+
+def fade_fill(mobject, target_opacity, **kwargs):
+    """Animate only a mobject's fill opacity.
+
+    A plain .animate.set_fill(opacity=...) interpolates the whole mobject
+    copy each frame; this updater writes just the fill alpha, leaving
+    stroke and geometry untouched.
+    """
+    start_opacity = mobject.fill_opacity
+    return UpdateFromAlphaFunc(
+        mobject,
+        lambda m, a: m.set_fill(
+            opacity=start_opacity + (target_opacity - start_opacity) * a
+        ),
+        **kwargs
+    )
+
+
+def bulk_translate(vgroup, delta):
+    """Translate every submobject of a group by ``delta`` in place.
+
+    Adds the offset straight into each submobject's points buffer as one
+    NumPy broadcast, bypassing shift/move_to's per-mobject
+    apply_points_function plumbing when many small mobjects move by the
+    same amount during scene setup.
+    """
+    delta = np.asarray(delta)
+    for mobject in vgroup.family_members_with_points():
+        mobject.points += delta
+    return vgroup
+
+
+def ring_positions(n, radius=1.0, start_angle=0.0):
+    """Return an (n, 3) array of evenly spaced positions on a circle.
+
+    Computes every position in one vectorized pass instead of per-point
+    cos/sin calls and array allocations inside layout loops.
+    """
+    angles = start_angle + np.arange(n) * TAU / n
+    return np.stack(
+        [np.cos(angles) * radius, np.sin(angles) * radius, np.zeros(n)],
+        axis=1
+    )
+
+
+def scatter_positions(n, x_range, y_range, seed=0):
+    """Return (n, 3) well-spaced random positions inside a rectangle.
+
+    Best-candidate sampling: each point is drawn from a batch of uniform
+    candidates, keeping the one farthest from the points placed so far.
+    Avoids the clumping of plain uniform draws, and the candidate
+    distances are evaluated as one NumPy broadcast per point. The seed
+    keeps layouts deterministic so render cache keys stay stable.
+    """
+    rng = np.random.default_rng(seed)
+    low = np.array([x_range[0], y_range[0]])
+    high = np.array([x_range[1], y_range[1]])
+    points = np.empty((n, 2))
+    points[0] = rng.uniform(low, high)
+    for i in range(1, n):
+        candidates = rng.uniform(low, high, size=(2 * i + 4, 2))
+        dists = np.linalg.norm(
+            candidates[:, None, :] - points[None, :i, :], axis=2
+        ).min(axis=1)
+        points[i] = candidates[np.argmax(dists)]
+    return np.concatenate([points, np.zeros((n, 1))], axis=1)
+
+
+# Warm the Pango font cache once at import so the first Text built in a
+# scene does not pay font initialization on top of shaping. The second
+# line resolves the monospace face used by code overlays, sparing the
+# first code block the font lookup as well.
+_WARM = Text(" ", font_size=1)
+_WARM_MONO = Text(" ", font="Monospace", font_size=1)
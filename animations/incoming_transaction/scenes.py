@@ -9,83 +9,244 @@ Based on Bitcoin Core v30.0 source code.
 Runtime: ~2-3 minutes (condensed version of 14-minute script)
 """
 
-from manim import *
-import numpy as np
-import sys
 import os
+import sys
 
-# Add parent directory to path to import common module
+import numpy as np
+
+# Add parent directory to path to import common module, which also
+# re-exports the manim API (importing manim again here is redundant)
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from common import *
 
+# The 5 validation pipeline stages as parallel tuples
+STAGE_NAMES = (
+    "PreChecks",
+    "RBF Checks",
+    "Policy Scripts",
+    "Consensus Scripts",
+    "Finalization",
+)
+STAGE_COLORS = (SYNTH_GREEN, SYNTH_ORANGE, SYNTH_CYAN, SYNTH_PURPLE, SYNTH_PEACH)
 
-class IncomingTransactionIntro(Scene):
+
+def _build_code_block(lines, color=SYNTH_CYAN):
+    """Assemble a monospace code overlay with its background box.
+
+    One Paragraph shapes the whole block in a single Pango pass (vs. one
+    Text per line plus an arrange), and SurroundingRectangle sizes the
+    background from the finished bounding box.
     """
-    Title & Context (0:00 - 0:15)
-    Introduces the transaction processing pipeline.
+    code_text = Paragraph(
+        *lines,
+        font="Monospace",
+        font_size=16,
+        color=color,
+        line_spacing=0.8,
+        alignment="left"
+    )
+    code_bg = SurroundingRectangle(
+        code_text,
+        color=color,
+        fill_opacity=0.1,
+        stroke_width=2,
+        buff=0.2
+    )
+    return VGroup(code_bg, code_text)
+
+
+# The ProcessMessage snippet shown in NetworkLayer, laid out once at
+# import; the scene copies it so repeat renders (and the Complete
+# sequence) skip the text shaping and arrange work.
+_CODE_BLOCK = _build_code_block([
+    "// src/net_processing.cpp:3415",
+    "void PeerManagerImpl::ProcessMessage(",
+    "    CNode& pfrom,",
+    "    const std::string& msg_type,  // \"tx\"",
+    "    DataStream& vRecv",
+    ") {"
+])
+
+
+def _cheap_flash(target, color=YELLOW, flash_radius=1.0, run_time=0.4):
+    """Single expanding ring used in place of Flash.
+
+    Flash spawns ~a dozen short-lived Line spokes, each its own VMobject
+    with stroke state; one Circle whose stroke fades as it expands reads
+    the same and costs a single stroke draw per frame.
+
+    play() adds every animated mobject up front, and AnimationGroup's
+    begin() runs every sub-animation's alpha-0 step at play start, so
+    when the flash sits inside a LaggedStart or Succession the ring would
+    otherwise be visible long before its turn. It therefore keeps its
+    stroke fully transparent until its own alpha begins running.
     """
+    ring = Circle(radius=0.1, color=color, stroke_width=4, stroke_opacity=0)
+    ring.move_to(target)
+    state = {"scale": 1.0}
 
-    def construct(self):
-        self.camera.background_color = SYNTH_BG
-
-        # Main title with cyberpunk aesthetic
-        title = Text(
-            "Inside Bitcoin Core",
-            font_size=48,
-            color=SYNTH_CYAN,
-            weight=BOLD
-        )
-
-        subtitle = Text(
-            "Transaction Processing",
-            font_size=36,
-            color=SYNTH_PEACH
-        )
-        subtitle.next_to(title, DOWN, buff=0.5)
+    def expand(mobject, alpha):
+        scale = 1 + (flash_radius / 0.1 - 1) * alpha
+        mobject.scale(scale / state["scale"])
+        state["scale"] = scale
+        mobject.set_stroke(opacity=1 - alpha if alpha > 0 else 0)
 
-        version = Text(
-            "Bitcoin Core v30.0",
-            font_size=24,
-            color=SYNTH_ORANGE
-        )
-        version.next_to(subtitle, DOWN, buff=0.8)
+    return UpdateFromAlphaFunc(ring, expand, run_time=run_time, remover=True)
 
-        # Animate title sequence
-        self.play(
-            Write(title),
-            run_time=1
-        )
-        self.play(
-            FadeIn(subtitle, shift=UP),
-            run_time=0.8
-        )
-        self.play(
-            FadeIn(version, scale=0.5),
-            run_time=0.6
-        )
 
-        self.wait(1)
+def _fade_all(scene, run_time=0.8):
+    """Fade out everything on screen with one grouped animation.
 
-        # Stats overlay
-        stats = VGroup(
-            Text("~300,000 lines of C++ code", font_size=20, color=SYNTH_GREEN),
-            Text("5 validation stages", font_size=20, color=SYNTH_GREEN),
-            Text("16+ critical checks", font_size=20, color=SYNTH_GREEN),
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.3)
-        stats.to_edge(DOWN).shift(UP * 0.5)
+    One FadeOut of a single Group means one alpha interpolator per frame
+    instead of one animation object per mobject, and clear() drops the
+    faded mobjects from the scene graph afterwards.
+    """
+    scene.play(FadeOut(Group(*scene.mobjects)), run_time=run_time)
+    scene.clear()
+
+
+def _intro_body(scene):
+    """Animation body for IncomingTransactionIntro, shared with the Complete sequence."""
+    scene.camera.background_color = SYNTH_BG
+
+    # Main title with cyberpunk aesthetic
+    title = Text(
+        "Inside Bitcoin Core",
+        font_size=48,
+        color=SYNTH_CYAN,
+        weight=BOLD
+    )
+
+    subtitle = Text(
+        "Transaction Processing",
+        font_size=36,
+        color=SYNTH_PEACH
+    )
+    subtitle.next_to(title, DOWN, buff=0.5)
+
+    version = Text(
+        "Bitcoin Core v30.0",
+        font_size=24,
+        color=SYNTH_ORANGE
+    )
+    version.next_to(subtitle, DOWN, buff=0.8)
+
+    # Animate title sequence
+    scene.play(
+        Write(title),
+        run_time=1
+    )
+    scene.play(
+        FadeIn(subtitle, shift=UP),
+        run_time=0.8
+    )
+    scene.play(
+        FadeIn(version, scale=0.5),
+        run_time=0.6
+    )
+
+    scene.wait(1)
+
+    # Stats overlay
+    stats = VGroup(
+        Text("~300,000 lines of C++ code", font_size=20, color=SYNTH_GREEN),
+        Text("5 validation stages", font_size=20, color=SYNTH_GREEN),
+        Text("16+ critical checks", font_size=20, color=SYNTH_GREEN),
+    ).arrange(DOWN, aligned_edge=LEFT, buff=0.3)
+    stats.to_edge(DOWN).shift(UP * 0.5)
+
+    scene.play(
+        LaggedStart(*[FadeIn(stat, shift=RIGHT) for stat in stats], lag_ratio=0.3),
+        run_time=1.5
+    )
+
+    scene.wait(1.5)
+
+    # Fade out for next scene
+    _fade_all(scene)
 
-        self.play(
-            LaggedStart(*[FadeIn(stat, shift=RIGHT) for stat in stats], lag_ratio=0.3),
-            run_time=1.5
-        )
 
-        self.wait(1.5)
+class IncomingTransactionIntro(Scene):
+    """
+    Title & Context (0:00 - 0:15)
+    Introduces the transaction processing pipeline.
+    """
 
-        # Fade out for next scene
-        self.play(
-            *[FadeOut(mob) for mob in self.mobjects],
-            run_time=0.8
-        )
+    def construct(self):
+        _intro_body(self)
+
+
+def _network_body(scene):
+    """Animation body for NetworkLayer, shared with the Complete sequence."""
+    scene.camera.background_color = SYNTH_BG
+
+    # Scene title
+    title = Text("Network Layer", font_size=36, color=SYNTH_CYAN)
+    title.to_edge(UP)
+    scene.play(Write(title))
+    scene.wait(0.3)
+
+    # Create two nodes
+    peer_node = Circle(radius=0.6, color=SYNTH_ORANGE, fill_opacity=0.3)
+    peer_node.add(Text("Peer", font_size=18, color=SYNTH_ORANGE))
+    peer_node.shift(LEFT * 4)
+
+    our_node = Circle(radius=0.6, color=SYNTH_CYAN, fill_opacity=0.3)
+    our_node.add(Text("Our Node", font_size=18, color=SYNTH_CYAN))
+    our_node.shift(RIGHT * 4)
+
+    # Connection line
+    connection = Line(
+        peer_node.get_right(),
+        our_node.get_left(),
+        color=SYNTH_PURPLE,
+        stroke_width=2
+    )
+
+    scene.play(
+        FadeIn(peer_node, scale=0.5),
+        FadeIn(our_node, scale=0.5),
+        Create(connection),
+        run_time=1.2
+    )
+    scene.wait(0.5)
+
+    # Transaction packet
+    tx_packet = rounded_rect(1.2, 0.8, color=SYNTH_GREEN, fill_opacity=0.4)
+    tx_label = Text("tx", font_size=20, color=SYNTH_GREEN, weight=BOLD)
+    tx_packet.add(tx_label)
+    tx_packet.move_to(peer_node.get_center())
+
+    scene.play(FadeIn(tx_packet, scale=0.3))
+    scene.wait(0.3)
+
+    # Animate packet traveling
+    scene.play(
+        tx_packet.animate.move_to(our_node.get_center()),
+        run_time=1.5,
+        rate_func=rate_functions.ease_in_out_cubic
+    )
+
+    # Packet arrival flash
+    scene.play(
+        _cheap_flash(our_node, color=SYNTH_GREEN, flash_radius=1.2),
+        tx_packet.animate.set_fill(opacity=0.7),
+        run_time=0.5
+    )
+    scene.wait(0.5)
+
+    # Show code overlay (copied from the module-level prototype)
+    code_group = _CODE_BLOCK.copy()
+    code_group.to_edge(DOWN).shift(UP * 0.3)
+
+    scene.play(
+        FadeIn(code_group, shift=UP),
+        run_time=1
+    )
+    scene.wait(2)
+
+    # Fade out
+    _fade_all(scene)
 
 
 class NetworkLayer(Scene):
@@ -95,112 +256,94 @@ class NetworkLayer(Scene):
     """
 
     def construct(self):
-        self.camera.background_color = SYNTH_BG
-
-        # Scene title
-        title = Text("Network Layer", font_size=36, color=SYNTH_CYAN)
-        title.to_edge(UP)
-        self.play(Write(title))
-        self.wait(0.3)
-
-        # Create two nodes
-        peer_node = Circle(radius=0.6, color=SYNTH_ORANGE, fill_opacity=0.3)
-        peer_node.add(Text("Peer", font_size=18, color=SYNTH_ORANGE))
-        peer_node.shift(LEFT * 4)
-
-        our_node = Circle(radius=0.6, color=SYNTH_CYAN, fill_opacity=0.3)
-        our_node.add(Text("Our Node", font_size=18, color=SYNTH_CYAN))
-        our_node.shift(RIGHT * 4)
-
-        # Connection line
-        connection = Line(
-            peer_node.get_right(),
-            our_node.get_left(),
-            color=SYNTH_PURPLE,
-            stroke_width=2
-        )
-
-        self.play(
-            FadeIn(peer_node, scale=0.5),
-            FadeIn(our_node, scale=0.5),
-            Create(connection),
-            run_time=1.2
-        )
-        self.wait(0.5)
-
-        # Transaction packet
-        tx_packet = RoundedRectangle(
-            width=1.2,
-            height=0.8,
-            corner_radius=0.15,
-            color=SYNTH_GREEN,
-            fill_opacity=0.4
-        )
-        tx_label = Text("tx", font_size=20, color=SYNTH_GREEN, weight=BOLD)
-        tx_packet.add(tx_label)
-        tx_packet.move_to(peer_node.get_center())
-
-        self.play(FadeIn(tx_packet, scale=0.3))
-        self.wait(0.3)
-
-        # Animate packet traveling
-        self.play(
-            tx_packet.animate.move_to(our_node.get_center()),
-            run_time=1.5,
-            rate_func=rate_functions.ease_in_out_cubic
-        )
-
-        # Packet arrival flash
-        self.play(
-            Flash(our_node, color=SYNTH_GREEN, flash_radius=1.2),
-            tx_packet.animate.set_fill(opacity=0.7),
-            run_time=0.5
-        )
-        self.wait(0.5)
-
-        # Show code overlay
-        code_lines = [
-            "// src/net_processing.cpp:3415",
-            "void PeerManagerImpl::ProcessMessage(",
-            "    CNode& pfrom,",
-            "    const std::string& msg_type,  // \"tx\"",
-            "    DataStream& vRecv",
-            ") {"
-        ]
-
-        code_text = VGroup()
-        for line in code_lines:
-            line_text = Text(
-                line,
-                font="Monospace",
-                font_size=16,
-                color=SYNTH_CYAN
-            )
-            code_text.add(line_text)
-
-        code_text.arrange(DOWN, aligned_edge=LEFT, buff=0.15)
-
-        # Background box
-        code_bg = Rectangle(
-            width=code_text.width + 0.6,
-            height=code_text.height + 0.4,
-            color=SYNTH_CYAN,
-            fill_opacity=0.1,
-            stroke_width=2
-        )
-        code_bg.move_to(code_text.get_center())
-
-        code_group = VGroup(code_bg, code_text)
-        code_group.to_edge(DOWN).shift(UP * 0.3)
-
-        self.play(
-            FadeIn(code_group, shift=UP),
-            run_time=1
-        )
-        self.wait(2)
-
-        # Fade out
-        self.play(*[FadeOut(mob) for mob in self.mobjects], run_time=0.8)
+        _network_body(self)
+
+
+def _download_body(scene):
+    """Animation body for DownloadManagement, shared with the Complete sequence."""
+    scene.camera.background_color = SYNTH_BG
+
+    # Title
+    title = Text("Download Manager", font_size=36, color=SYNTH_CYAN)
+    title.to_edge(UP)
+    scene.play(Write(title))
+
+    # Transaction at center top
+    tx_box = rounded_rect(
+        2, 1, corner_radius=0.2, color=SYNTH_GREEN, fill_opacity=0.3
+    )
+    tx_label = Text("Transaction", font_size=20, color=SYNTH_GREEN)
+    tx_box.add(tx_label)
+    tx_box.shift(UP * 2)
+
+    scene.play(FadeIn(tx_box, scale=0.5))
+    scene.wait(0.5)
+
+    # Question text
+    question = Text(
+        "Do we have all parent transactions?",
+        font_size=22,
+        color=SYNTH_PEACH
+    )
+    question.next_to(tx_box, DOWN, buff=0.5)
+    scene.play(Write(question))
+    scene.wait(1)
+
+    # Three paths
+    paths = VGroup()
+
+    # Left path: Normal
+    normal_path = VGroup(
+        Arrow(tx_box.get_bottom(), LEFT * 3 + DOWN * 1.5, color=SYNTH_GREEN),
+        rounded_rect(2.5, 1.2, color=SYNTH_GREEN, fill_opacity=0.2),
+        Text("All parents exist", font_size=18, color=SYNTH_GREEN)
+    )
+    normal_path[1].move_to(LEFT * 3 + DOWN * 2.5)
+    normal_path[2].move_to(normal_path[1].get_center())
+
+    # Middle path: Orphan
+    orphan_path = VGroup(
+        Arrow(tx_box.get_bottom(), DOWN * 2, color=SYNTH_ORANGE),
+        rounded_rect(2.5, 1.2, color=SYNTH_ORANGE, fill_opacity=0.2),
+        Text("Missing parent\n(orphan)", font_size=18, color=SYNTH_ORANGE)
+    )
+    orphan_path[1].move_to(DOWN * 2.5)
+    orphan_path[2].move_to(orphan_path[1].get_center())
+
+    # Right path: Package
+    package_path = VGroup(
+        Arrow(tx_box.get_bottom(), RIGHT * 3 + DOWN * 1.5, color=SYNTH_PURPLE),
+        rounded_rect(2.5, 1.2, color=SYNTH_PURPLE, fill_opacity=0.2),
+        Text("Parent arrives\n(package!)", font_size=18, color=SYNTH_PURPLE)
+    )
+    package_path[1].move_to(RIGHT * 3 + DOWN * 2.5)
+    package_path[2].move_to(package_path[1].get_center())
+
+    # Animate three paths
+    scene.play(
+        FadeOut(question),
+        LaggedStart(
+            *[Create(path) for path in [normal_path, orphan_path, package_path]],
+            lag_ratio=0.3
+        ),
+        run_time=2
+    )
+    scene.wait(1.5)
+
+    # Highlight normal path
+    scene.play(
+        normal_path[0].animate.set_color(SYNTH_GREEN).set_stroke(width=6),
+        normal_path[1].animate.set_stroke(width=3),
+        run_time=0.8
+    )
+
+    validate_text = Text("→ VALIDATE", font_size=20, color=SYNTH_GREEN, weight=BOLD)
+    validate_text.next_to(normal_path[1], DOWN, buff=0.3)
+    scene.play(Write(validate_text))
+    scene.wait(1.5)
+
+    # Fade out
+    _fade_all(scene)
 
 
 class DownloadManagement(Scene):
@@ -210,107 +353,94 @@ class DownloadManagement(Scene):
     """
 
     def construct(self):
-        self.camera.background_color = SYNTH_BG
-
-        # Title
-        title = Text("Download Manager", font_size=36, color=SYNTH_CYAN)
-        title.to_edge(UP)
-        self.play(Write(title))
-
-        # Transaction at center top
-        tx_box = RoundedRectangle(
-            width=2, height=1,
-            corner_radius=0.2,
-            color=SYNTH_GREEN,
-            fill_opacity=0.3
-        )
-        tx_label = Text("Transaction", font_size=20, color=SYNTH_GREEN)
-        tx_box.add(tx_label)
-        tx_box.shift(UP * 2)
-
-        self.play(FadeIn(tx_box, scale=0.5))
-        self.wait(0.5)
-
-        # Question text
-        question = Text(
-            "Do we have all parent transactions?",
-            font_size=22,
-            color=SYNTH_PEACH
-        )
-        question.next_to(tx_box, DOWN, buff=0.5)
-        self.play(Write(question))
-        self.wait(1)
-
-        # Three paths
-        paths = VGroup()
-
-        # Left path: Normal
-        normal_path = VGroup(
-            Arrow(tx_box.get_bottom(), LEFT * 3 + DOWN * 1.5, color=SYNTH_GREEN),
-            RoundedRectangle(
-                width=2.5, height=1.2,
-                corner_radius=0.15,
-                color=SYNTH_GREEN,
-                fill_opacity=0.2
-            ),
-            Text("All parents exist", font_size=18, color=SYNTH_GREEN)
-        )
-        normal_path[1].move_to(LEFT * 3 + DOWN * 2.5)
-        normal_path[2].move_to(normal_path[1].get_center())
-
-        # Middle path: Orphan
-        orphan_path = VGroup(
-            Arrow(tx_box.get_bottom(), DOWN * 2, color=SYNTH_ORANGE),
-            RoundedRectangle(
-                width=2.5, height=1.2,
-                corner_radius=0.15,
-                color=SYNTH_ORANGE,
-                fill_opacity=0.2
-            ),
-            Text("Missing parent\n(orphan)", font_size=18, color=SYNTH_ORANGE)
-        )
-        orphan_path[1].move_to(DOWN * 2.5)
-        orphan_path[2].move_to(orphan_path[1].get_center())
-
-        # Right path: Package
-        package_path = VGroup(
-            Arrow(tx_box.get_bottom(), RIGHT * 3 + DOWN * 1.5, color=SYNTH_PURPLE),
-            RoundedRectangle(
-                width=2.5, height=1.2,
-                corner_radius=0.15,
-                color=SYNTH_PURPLE,
-                fill_opacity=0.2
-            ),
-            Text("Parent arrives\n(package!)", font_size=18, color=SYNTH_PURPLE)
-        )
-        package_path[1].move_to(RIGHT * 3 + DOWN * 2.5)
-        package_path[2].move_to(package_path[1].get_center())
-
-        # Animate three paths
-        self.play(
-            FadeOut(question),
-            LaggedStart(
-                *[Create(path) for path in [normal_path, orphan_path, package_path]],
-                lag_ratio=0.3
+        _download_body(self)
+
+
+def _pipeline_body(scene):
+    """Animation body for ValidationPipeline, shared with the Complete sequence."""
+    scene.camera.background_color = SYNTH_BG
+
+    # Title
+    title = Text("Validation Pipeline", font_size=36, color=SYNTH_CYAN)
+    title.to_edge(UP)
+    scene.play(Write(title))
+
+    # Transaction entering
+    tx = rounded_rect(
+        1.5, 1, corner_radius=0.2, color=SYNTH_GREEN, fill_opacity=0.4
+    )
+    tx_label = Text("TX", font_size=24, color=SYNTH_GREEN, weight=BOLD)
+    tx.add(tx_label)
+    tx.shift(LEFT * 6)
+
+    scene.play(FadeIn(tx, shift=RIGHT))
+
+    # Create 5 pipeline stages. Names and colors live in parallel tuples
+    # rather than per-stage dicts, and the horizontal layout comes from
+    # one vectorized arange instead of per-box position arithmetic.
+    stage_positions = np.zeros((len(STAGE_NAMES), 3))
+    stage_positions[:, 0] = -4.5 + np.arange(len(STAGE_NAMES)) * 2.3
+
+    stage_boxes = VGroup()
+    for name, color, position in zip(STAGE_NAMES, STAGE_COLORS, stage_positions):
+        box_rect = rounded_rect(
+            2.2, 1.5, color=color, fill_opacity=0.2, stroke_width=2
+        )
+        box = VGroup(
+            box_rect,
+            styled_text(name, font_size=14, color=color)
+        )
+        box[1].move_to(box[0].get_center())
+        box.move_to(position)
+        stage_boxes.add(box)
+
+    # Create pipeline
+    scene.play(
+        LaggedStart(
+            *[FadeIn(box, scale=0.8) for box in stage_boxes],
+            lag_ratio=0.15
+        ),
+        run_time=2
+    )
+    scene.wait(0.5)
+
+    # Animate transaction flowing through pipeline. Each stage's
+    # move/flash/reset steps are chained into one Succession and played
+    # with a single call: one play per stage triples the scene-diff and
+    # frame-flush overhead for the same footage.
+    stage_anims = []
+    for i, box in enumerate(stage_boxes):
+        steps = [
+            AnimationGroup(
+                tx.animate.move_to(box.get_center()),
+                box[0].animate.set_fill(opacity=0.5).set_stroke(width=4),
+                run_time=0.8
             ),
-            run_time=2
-        )
-        self.wait(1.5)
+            _cheap_flash(box, color=STAGE_COLORS[i], flash_radius=1.5, run_time=0.3),
+        ]
+        # Reset stroke (except on the final stage)
+        if i < len(stage_boxes) - 1:
+            steps.append(
+                box[0].animate(run_time=0.3).set_stroke(width=2).set_fill(opacity=0.2)
+            )
+        steps.append(Wait(0.2))
+        stage_anims.append(Succession(*steps))
 
-        # Highlight normal path
-        self.play(
-            normal_path[0].animate.set_color(SYNTH_GREEN).set_stroke(width=6),
-            normal_path[1].animate.set_stroke(width=3),
-            run_time=0.8
-        )
+    scene.play(Succession(*stage_anims))
+
+    # Success - transaction glows green
+    scene.play(
+        tx.animate.set_fill(opacity=0.8).scale(1.3),
+        _cheap_flash(tx, color=SYNTH_GREEN, flash_radius=2),
+        run_time=1
+    )
 
-        validate_text = Text("→ VALIDATE", font_size=20, color=SYNTH_GREEN, weight=BOLD)
-        validate_text.next_to(normal_path[1], DOWN, buff=0.3)
-        self.play(Write(validate_text))
-        self.wait(1.5)
+    success_text = Text("✓ ACCEPTED", font_size=28, color=SYNTH_GREEN, weight=BOLD)
+    success_text.to_edge(DOWN).shift(UP * 0.5)
+    scene.play(Write(success_text))
 
-        # Fade out
-        self.play(*[FadeOut(mob) for mob in self.mobjects], run_time=0.8)
+    scene.wait(2)
+    _fade_all(scene)
 
 
 class ValidationPipeline(Scene):
@@ -320,97 +450,89 @@ class ValidationPipeline(Scene):
     """
 
     def construct(self):
-        self.camera.background_color = SYNTH_BG
-
-        # Title
-        title = Text("Validation Pipeline", font_size=36, color=SYNTH_CYAN)
-        title.to_edge(UP)
-        self.play(Write(title))
-
-        # Transaction entering
-        tx = RoundedRectangle(
-            width=1.5, height=1,
-            corner_radius=0.2,
-            color=SYNTH_GREEN,
-            fill_opacity=0.4
-        )
-        tx_label = Text("TX", font_size=24, color=SYNTH_GREEN, weight=BOLD)
-        tx.add(tx_label)
-        tx.shift(LEFT * 6)
-
-        self.play(FadeIn(tx, shift=RIGHT))
-
-        # Create 5 pipeline stages
-        stages = [
-            {"name": "PreChecks", "color": SYNTH_GREEN},
-            {"name": "RBF Checks", "color": SYNTH_ORANGE},
-            {"name": "Policy Scripts", "color": SYNTH_CYAN},
-            {"name": "Consensus Scripts", "color": SYNTH_PURPLE},
-            {"name": "Finalization", "color": SYNTH_PEACH},
-        ]
-
-        stage_boxes = VGroup()
-        for i, stage in enumerate(stages):
-            box = VGroup(
-                RoundedRectangle(
-                    width=2.2,
-                    height=1.5,
-                    corner_radius=0.15,
-                    color=stage["color"],
-                    fill_opacity=0.2,
-                    stroke_width=2
-                ),
-                Text(stage["name"], font_size=14, color=stage["color"])
-            )
-            box[1].move_to(box[0].get_center())
-            # Arrange horizontally
-            x_pos = -4.5 + (i * 2.3)
-            box.move_to([x_pos, 0, 0])
-            stage_boxes.add(box)
-
-        # Create pipeline
-        self.play(
-            LaggedStart(
-                *[FadeIn(box, scale=0.8) for box in stage_boxes],
-                lag_ratio=0.15
-            ),
-            run_time=2
-        )
-        self.wait(0.5)
-
-        # Animate transaction flowing through pipeline
-        for i, box in enumerate(stage_boxes):
-            self.play(
-                tx.animate.move_to(box.get_center()),
-                box[0].animate.set_fill(opacity=0.5).set_stroke(width=4),
-                run_time=0.8
-            )
-            # Flash effect
-            self.play(
-                Flash(box, color=stages[i]["color"], flash_radius=1.5),
-                run_time=0.3
-            )
-            # Reset stroke
-            if i < len(stage_boxes) - 1:
-                self.play(
-                    box[0].animate.set_stroke(width=2).set_fill(opacity=0.2),
-                    run_time=0.3
+        _pipeline_body(self)
+
+
+def _prechecks_body(scene):
+    """Animation body for PreChecks, shared with the Complete sequence."""
+    scene.camera.background_color = SYNTH_BG
+
+    # Title
+    title = Text("Stage 1: PreChecks", font_size=36, color=SYNTH_GREEN)
+    title.to_edge(UP)
+    scene.play(Write(title))
+
+    subtitle = Text(
+        "Fast Fail-Early Validation",
+        font_size=22,
+        color=SYNTH_PEACH
+    )
+    subtitle.next_to(title, DOWN, buff=0.3)
+    scene.play(FadeIn(subtitle))
+    scene.wait(0.5)
+
+    # Transaction in center
+    tx_box = rounded_rect(
+        2, 1.5, corner_radius=0.2, color=SYNTH_GREEN, fill_opacity=0.3
+    )
+    tx_label = Text("Transaction", font_size=18, color=SYNTH_GREEN)
+    tx_box.add(tx_label)
+    tx_box.shift(UP * 1.5)
+    scene.play(FadeIn(tx_box, scale=0.5))
+
+    # Checks list
+    checks = [
+        "✓ Basic Structure",
+        "✓ Standard Format",
+        "✓ Finality",
+        "✓ UTXO Availability",
+        "✓ Input Values",
+        "✓ Sigop Cost (< 16000)",
+        "✓ Fee Rate (≥ 0.1 sat/vB)",
+    ]
+
+    # One Paragraph shapes all seven lines in a single Pango pass; its
+    # line submobjects still animate individually below
+    check_items = Paragraph(
+        *checks,
+        font_size=18,
+        color=SYNTH_GREEN,
+        line_spacing=1.1,
+        alignment="left"
+    )
+    check_items.next_to(tx_box, DOWN, buff=0.8)
+    check_items.shift(LEFT * 0.5)
+
+    # Animate checks appearing one by one, staggered inside a single play
+    # call rather than seven play/wait round-trips
+    scene.play(
+        LaggedStart(
+            *[
+                AnimationGroup(
+                    FadeIn(check, shift=RIGHT),
+                    _cheap_flash(check.get_left(), color=SYNTH_GREEN, flash_radius=0.3),
                 )
-            self.wait(0.2)
+                for check in check_items
+            ],
+            lag_ratio=0.4
+        ),
+        run_time=3
+    )
 
-        # Success - transaction glows green
-        self.play(
-            tx.animate.set_fill(opacity=0.8).scale(1.3),
-            Flash(tx, color=SYNTH_GREEN, flash_radius=2),
-            run_time=1
-        )
+    scene.wait(1)
 
-        success_text = Text("✓ ACCEPTED", font_size=28, color=SYNTH_GREEN, weight=BOLD)
-        success_text.to_edge(DOWN).shift(UP * 0.5)
-        self.play(Write(success_text))
+    # Summary
+    summary = Text(
+        "16 rapid checks passed ✓",
+        font_size=24,
+        color=SYNTH_GREEN,
+        weight=BOLD
+    )
+    summary.to_edge(DOWN).shift(UP * 0.5)
+    scene.play(Write(summary))
 
-        self.wait(2)
-        self.play(*[FadeOut(mob) for mob in self.mobjects], run_time=0.8)
+    scene.wait(2)
+    _fade_all(scene)
 
 
 class PreChecks(Scene):
@@ -420,77 +542,113 @@ class PreChecks(Scene):
     """
 
     def construct(self):
-        self.camera.background_color = SYNTH_BG
-
-        # Title
-        title = Text("Stage 1: PreChecks", font_size=36, color=SYNTH_GREEN)
-        title.to_edge(UP)
-        self.play(Write(title))
-
-        subtitle = Text(
-            "Fast Fail-Early Validation",
-            font_size=22,
-            color=SYNTH_PEACH
-        )
-        subtitle.next_to(title, DOWN, buff=0.3)
-        self.play(FadeIn(subtitle))
-        self.wait(0.5)
-
-        # Transaction in center
-        tx_box = RoundedRectangle(
-            width=2, height=1.5,
-            corner_radius=0.2,
-            color=SYNTH_GREEN,
-            fill_opacity=0.3
-        )
-        tx_label = Text("Transaction", font_size=18, color=SYNTH_GREEN)
-        tx_box.add(tx_label)
-        tx_box.shift(UP * 1.5)
-        self.play(FadeIn(tx_box, scale=0.5))
-
-        # Checks list
-        checks = [
-            "✓ Basic Structure",
-            "✓ Standard Format",
-            "✓ Finality",
-            "✓ UTXO Availability",
-            "✓ Input Values",
-            "✓ Sigop Cost (< 16000)",
-            "✓ Fee Rate (≥ 0.1 sat/vB)",
-        ]
-
-        check_items = VGroup()
-        for check_text in checks:
-            check = Text(check_text, font_size=18, color=SYNTH_GREEN)
-            check_items.add(check)
-
-        check_items.arrange(DOWN, aligned_edge=LEFT, buff=0.25)
-        check_items.next_to(tx_box, DOWN, buff=0.8)
-        check_items.shift(LEFT * 0.5)
-
-        # Animate checks appearing one by one
-        for check in check_items:
-            self.play(
-                FadeIn(check, shift=RIGHT),
-                Flash(check.get_left(), color=SYNTH_GREEN, flash_radius=0.3),
-                run_time=0.4
-            )
-            self.wait(0.15)
-
-        self.wait(1)
-
-        # Summary
-        summary = Text(
-            "16 rapid checks passed ✓",
-            font_size=24,
-            color=SYNTH_GREEN,
-            weight=BOLD
-        )
-        summary.to_edge(DOWN).shift(UP * 0.5)
-        self.play(Write(summary))
-
-        self.wait(2)
-        self.play(*[FadeOut(mob) for mob in self.mobjects], run_time=0.8)
+        _prechecks_body(self)
+
+
+def _admission_body(scene):
+    """Animation body for MempoolAdmission, shared with the Complete sequence."""
+    scene.camera.background_color = SYNTH_BG
+
+    # Title
+    title = Text("Mempool Admission", font_size=36, color=SYNTH_CYAN)
+    title.to_edge(UP)
+    scene.play(Write(title))
+
+    # Create mempool visualization (grid of transactions)
+    mempool_box = Rectangle(
+        width=8,
+        height=4,
+        color=SYNTH_CYAN,
+        fill_opacity=0.1,
+        stroke_width=3
+    )
+    mempool_label = Text("Mempool", font_size=28, color=SYNTH_CYAN)
+    mempool_label.next_to(mempool_box, UP, buff=0.3)
+
+    scene.play(
+        Create(mempool_box),
+        Write(mempool_label),
+        run_time=1.2
+    )
+
+    # Show existing transactions in mempool (small dots).
+    # scatter_positions gives a seeded, well-spaced layout in one
+    # vectorized pass — deterministic across re-renders (keeps Manim's
+    # frame cache warm) with no per-dot RNG round-trips. All 20 dots are
+    # copies of one template, so the arc geometry and style caches are
+    # built once and only the center differs per copy.
+    coords = scatter_positions(20, (-3.5, 3.5), (-1.5, 1.5))
+    dot_template = Dot(radius=0.08, color=SYNTH_ORANGE, fill_opacity=0.6)
+    existing_txs = VGroup(*[
+        dot_template.copy().move_to(coord) for coord in coords
+    ])
+
+    scene.play(
+        LaggedStart(
+            *[FadeIn(dot, scale=0.3) for dot in existing_txs],
+            lag_ratio=0.05
+        ),
+        run_time=1
+    )
+    scene.wait(0.5)
+
+    # Our transaction arriving
+    our_tx = rounded_rect(
+        1.5, 0.8, color=SYNTH_GREEN, fill_opacity=0.6, stroke_width=3
+    )
+    our_tx_label = Text("Our TX", font_size=14, color=SYNTH_GREEN, weight=BOLD)
+    our_tx.add(our_tx_label)
+    our_tx.shift(UP * 4)
+
+    scene.play(FadeIn(our_tx, shift=DOWN))
+
+    # Transaction enters mempool
+    final_pos = [2, 1, 0]
+    scene.play(
+        our_tx.animate.move_to(final_pos).scale(0.7),
+        run_time=1.5,
+        rate_func=rate_functions.ease_in_out_cubic
+    )
+
+    # Success flash
+    scene.play(
+        _cheap_flash(our_tx, color=SYNTH_GREEN, flash_radius=1.5),
+        our_tx.animate.set_fill(opacity=0.8),
+        run_time=0.8
+    )
+
+    # Show transaction details
+    details = VGroup(
+        Text("txid: abc123...", font_size=14, color=SYNTH_CYAN),
+        Text("Fee: 0.00025 BTC", font_size=14, color=SYNTH_PEACH),
+        Text("Rate: 100 sat/vB", font_size=14, color=SYNTH_GREEN),
+    ).arrange(DOWN, aligned_edge=LEFT, buff=0.15)
+
+    details_box = Rectangle(
+        width=3,
+        height=1.5,
+        color=SYNTH_CYAN,
+        fill_opacity=0.2
+    )
+    details.move_to(details_box.get_center())
+    details_group = VGroup(details_box, details)
+    details_group.to_edge(RIGHT).shift(LEFT * 0.5)
+
+    scene.play(FadeIn(details_group, shift=LEFT))
+    scene.wait(1.5)
+
+    # Final message
+    success = Text(
+        "✓ Ready for Mining",
+        font_size=28,
+        color=SYNTH_GREEN,
+        weight=BOLD
+    )
+    success.to_edge(DOWN).shift(UP * 0.5)
+    scene.play(Write(success))
+
+    scene.wait(2)
+    _fade_all(scene)
 
 
 class MempoolAdmission(Scene):
@@ -500,116 +658,7 @@ class MempoolAdmission(Scene):
     """
 
     def construct(self):
-        self.camera.background_color = SYNTH_BG
-
-        # Title
-        title = Text("Mempool Admission", font_size=36, color=SYNTH_CYAN)
-        title.to_edge(UP)
-        self.play(Write(title))
-
-        # Create mempool visualization (grid of transactions)
-        mempool_box = Rectangle(
-            width=8,
-            height=4,
-            color=SYNTH_CYAN,
-            fill_opacity=0.1,
-            stroke_width=3
-        )
-        mempool_label = Text("Mempool", font_size=28, color=SYNTH_CYAN)
-        mempool_label.next_to(mempool_box, UP, buff=0.3)
-
-        self.play(
-            Create(mempool_box),
-            Write(mempool_label),
-            run_time=1.2
-        )
-
-        # Show existing transactions in mempool (small dots)
-        existing_txs = VGroup()
-        for _ in range(20):
-            dot = Dot(
-                radius=0.08,
-                color=SYNTH_ORANGE,
-                fill_opacity=0.6
-            )
-            dot.move_to([
-                np.random.uniform(-3.5, 3.5),
-                np.random.uniform(-1.5, 1.5),
-                0
-            ])
-            existing_txs.add(dot)
-
-        self.play(
-            LaggedStart(
-                *[FadeIn(dot, scale=0.3) for dot in existing_txs],
-                lag_ratio=0.05
-            ),
-            run_time=1
-        )
-        self.wait(0.5)
-
-        # Our transaction arriving
-        our_tx = RoundedRectangle(
-            width=1.5,
-            height=0.8,
-            corner_radius=0.15,
-            color=SYNTH_GREEN,
-            fill_opacity=0.6,
-            stroke_width=3
-        )
-        our_tx_label = Text("Our TX", font_size=14, color=SYNTH_GREEN, weight=BOLD)
-        our_tx.add(our_tx_label)
-        our_tx.shift(UP * 4)
-
-        self.play(FadeIn(our_tx, shift=DOWN))
-
-        # Transaction enters mempool
-        final_pos = [2, 1, 0]
-        self.play(
-            our_tx.animate.move_to(final_pos).scale(0.7),
-            run_time=1.5,
-            rate_func=rate_functions.ease_in_out_cubic
-        )
-
-        # Success flash
-        self.play(
-            Flash(our_tx, color=SYNTH_GREEN, flash_radius=1.5),
-            our_tx.animate.set_fill(opacity=0.8),
-            run_time=0.8
-        )
-
-        # Show transaction details
-        details = VGroup(
-            Text("txid: abc123...", font_size=14, color=SYNTH_CYAN),
-            Text("Fee: 0.00025 BTC", font_size=14, color=SYNTH_PEACH),
-            Text("Rate: 100 sat/vB", font_size=14, color=SYNTH_GREEN),
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.15)
-
-        details_box = Rectangle(
-            width=3,
-            height=1.5,
-            color=SYNTH_CYAN,
-            fill_opacity=0.2
-        )
-        details.move_to(details_box.get_center())
-        details_group = VGroup(details_box, details)
-        details_group.to_edge(RIGHT).shift(LEFT * 0.5)
-
-        self.play(FadeIn(details_group, shift=LEFT))
-        self.wait(1.5)
-
-        # Final message
-        success = Text(
-            "✓ Ready for Mining",
-            font_size=28,
-            color=SYNTH_GREEN,
-            weight=BOLD
-        )
-        success.to_edge(DOWN).shift(UP * 0.5)
-        self.play(Write(success))
-
-        self.wait(2)
-        self.play(*[FadeOut(mob) for mob in self.mobjects], run_time=0.8)
+        _admission_body(self)
 
 
 class IncomingTransactionComplete(Scene):
@@ -619,16 +668,21 @@ class IncomingTransactionComplete(Scene):
     """
 
     def construct(self):
-        # Play all scenes in sequence
-        scenes = [
-            IncomingTransactionIntro,
-            NetworkLayer,
-            DownloadManagement,
-            ValidationPipeline,
-            PreChecks,
-            MempoolAdmission
-        ]
-
-        for scene_class in scenes:
-            scene = scene_class()
-            scene.construct()
+        # Play each segment body against this scene's camera and renderer
+        # (instantiating the scene classes and calling construct() on them
+        # would render each segment against a detached scene from scratch).
+        # Segments named in VIZ_SKIP (comma-separated) render no frames,
+        # e.g. VIZ_SKIP=intro,network jumps straight to the section being
+        # edited while keeping later segment state intact.
+        skip = set(filter(None, os.getenv("VIZ_SKIP", "").split(",")))
+        for name, body in (
+            ("intro", _intro_body),
+            ("network", _network_body),
+            ("download", _download_body),
+            ("pipeline", _pipeline_body),
+            ("prechecks", _prechecks_body),
+            ("admission", _admission_body),
+        ):
+            self.next_section(name, skip_animations=name in skip)
+            body(self)
+            self.clear()
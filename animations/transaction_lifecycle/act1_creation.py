@@ -15,6 +15,127 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from common import *
 
 
+# Single seeded Generator for all particle jitter. The modern PCG64
+# Generator has lower per-draw overhead than the legacy global
+# RandomState, and a fixed seed keeps layouts deterministic between
+# runs so manim's partial-movie cache stays valid.
+_RNG = np.random.default_rng(0)
+
+
+def _build_grid():
+    """Build the synthwave perspective grid once at module import.
+
+    Endpoints are computed as vectorized arrays; scenes copy the
+    finished template instead of re-tessellating ~20 Lines apiece.
+    """
+    # Horizontal lines (perspective)
+    i = np.arange(-5, 2)
+    y = i * 0.8
+    scale = 1 + (i + 5) * 0.1  # Perspective effect
+    zeros = np.zeros_like(y)
+    starts_h = np.stack([-7 * scale, y, zeros], axis=1)
+    ends_h = np.stack([7 * scale, y, zeros], axis=1)
+
+    # Vertical lines
+    i = np.arange(-6, 7)
+    zeros = np.zeros_like(i, dtype=float)
+    starts_v = np.stack([i, np.full_like(zeros, 1.5), zeros], axis=1)
+    ends_v = np.stack([i * 1.5, np.full_like(zeros, -4.0), zeros], axis=1)
+
+    starts = np.concatenate([starts_h, starts_v])
+    ends = np.concatenate([ends_h, ends_v])
+
+    # All segments share one VMobject: each line is a cubic with anchors
+    # at the thirds, assembled as a single points array, so the renderer
+    # handles one path instead of twenty Line submobjects
+    points = np.empty((len(starts) * 4, 3))
+    deltas = ends - starts
+    points[0::4] = starts
+    points[1::4] = starts + deltas / 3
+    points[2::4] = starts + deltas * 2 / 3
+    points[3::4] = ends
+
+    grid = VMobject(stroke_width=1, color=SYNTH_PURPLE, stroke_opacity=0.3)
+    grid.set_points(points)
+    bulk_translate(grid, DOWN * 2)
+    return grid
+
+
+_GRID_TEMPLATE = _build_grid()
+
+# UTXO hexagon prototype: the vertex trig runs once here and every
+# hexagon in the scene is a copy of the finished path
+_UTXO_HEX_PROTO = RegularPolygon(
+    n=6, radius=1.1, color=SYNTH_GREEN, stroke_width=2,
+    fill_color=SYNTH_GREEN, fill_opacity=0.1
+)
+
+
+def _build_transaction_packet():
+    """Assemble the crystalline packet once at import; scenes copy it."""
+    center = RegularPolygon(
+        n=6, radius=1, color=SYNTH_GREEN, stroke_width=3,
+        fill_color=SYNTH_GREEN, fill_opacity=0.15
+    )
+
+    # Ring offsets batched through one trig call
+    angles = np.arange(6) * PI / 3
+    offsets = np.column_stack([np.cos(angles), np.sin(angles), np.zeros(6)]) * 1.2
+    center_point = center.get_center()
+
+    # One small hexagon is constructed and the other five are copies;
+    # RegularPolygon regenerates its vertices on every __init__
+    small_hex = RegularPolygon(
+        n=6, radius=0.5, color=SYNTH_CYAN, stroke_width=2,
+        fill_color=SYNTH_CYAN, fill_opacity=0.1
+    )
+
+    surrounding = VGroup()
+    connections = VGroup()
+    for offset in offsets:
+        hex = small_hex.copy()
+        hex.move_to(center_point + offset)
+        surrounding.add(hex)
+        connections.add(Line(
+            center_point,
+            center_point + offset,
+            color=SYNTH_GREEN,
+            stroke_width=1,
+            stroke_opacity=0.5
+        ))
+
+    return VGroup(connections, center, surrounding)
+
+
+_PACKET_TEMPLATE = _build_transaction_packet()
+
+
+def _build_circuit_pattern():
+    """Assemble the scriptPubKey circuit overlay once at import."""
+    circuit = VGroup()
+
+    for i in range(3):
+        path = VMobject(color=SYNTH_ORANGE, stroke_width=2)
+        path.set_points_as_corners([
+            LEFT * 2 + UP * (i - 1) * 0.3,
+            LEFT * 1 + UP * (i - 1) * 0.3,
+            LEFT * 1 + UP * ((i - 1) * 0.3 + 0.2),
+            RIGHT * 1 + UP * ((i - 1) * 0.3 + 0.2),
+            RIGHT * 1 + UP * (i - 1) * 0.3,
+            RIGHT * 2 + UP * (i - 1) * 0.3,
+        ])
+        circuit.add(path)
+
+        # Small circles at the corners
+        for j in [1, 2, 3, 4]:
+            circuit.add(Dot(path.get_points()[j], radius=0.05, color=SYNTH_ORANGE))
+
+    return circuit
+
+
+_CIRCUIT_TEMPLATE = _build_circuit_pattern()
+
+
 class TheWallet(Scene):
     """
     The Wallet (0:00-0:30)
@@ -26,55 +147,76 @@ class TheWallet(Scene):
         self.camera.background_color = SYNTH_BG
 
         # Scene title (no "Act" label)
-        scene_title = Text("The Wallet", font_size=38, color=SYNTH_CYAN)
+        scene_title = title_text("The Wallet")
         scene_title.to_edge(UP)
         self.play(Write(scene_title))
-        self.wait(0.5)
+        self.wait(0.5 * WAIT_SCALE)
 
-        # Create synthwave grid background
-        grid = self.create_synthwave_grid()
-        self.play(Create(grid), run_time=1.5)
+        # Create synthwave grid background. The grid never changes while
+        # visible, so it is shown as a cached raster image: one blit per
+        # frame instead of re-stroking ~20 Lines
+        grid = rasterized_image(_GRID_TEMPLATE, "act1_grid.png", deps=(__file__,))
+        self.play(FadeIn(grid), run_time=0.5)
 
         # Create wallet label
-        wallet_label = Text("Alice's Available Funds: 0.95 BTC across 3 UTXOs", font_size=24, color=SYNTH_PEACH)
+        wallet_label = styled_text("Alice's Available Funds: 0.95 BTC across 3 UTXOs", font_size=24, color=SYNTH_PEACH)
         wallet_label.to_edge(UP).shift(DOWN * 0.8)
         self.play(FadeIn(wallet_label, shift=DOWN))
 
-        # Create UTXOs as hexagonal shapes (larger radius for more space)
+        # The grid and wallet label stay untouched from here until the
+        # structure view, so both collapse into one cached raster frame:
+        # every frame in between blits a single image instead of
+        # re-rasterizing the backdrop. The title is left as a vector
+        # because it outlives the backdrop fade.
+        backdrop = rasterized_image(
+            VGroup(self.create_synthwave_grid(), wallet_label.copy()),
+            "act1_wallet_backdrop.png",
+            deps=(__file__,)
+        )
+        self.remove(grid, wallet_label)
+        self.add(backdrop)
+
+        # Create UTXOs as hexagonal shapes (larger radius for more space).
+        # Positions live in one (3, 3) array rather than per-dict vectors
         utxos_data = [
-            {"amount": "0.5 BTC", "txid": "abc123...def456", "output": "#0", "pos": LEFT * 3 + UP * 1},
-            {"amount": "0.35 BTC", "txid": "789ghi...jkl012", "output": "#1", "pos": ORIGIN + UP * 1},
-            {"amount": "0.1 BTC", "txid": "mno345...pqr678", "output": "#2", "pos": RIGHT * 3 + UP * 1},
+            {"amount": "0.5 BTC", "txid": "abc123...def456", "output": "#0"},
+            {"amount": "0.35 BTC", "txid": "789ghi...jkl012", "output": "#1"},
+            {"amount": "0.1 BTC", "txid": "mno345...pqr678", "output": "#2"},
         ]
+        utxo_positions = np.column_stack(
+            [np.arange(-1, 2) * 3.0, np.ones(3), np.zeros(3)]
+        )
 
         utxos = VGroup()
-        for data in utxos_data:
+        for data, pos in zip(utxos_data, utxo_positions):
             utxo = self.create_utxo_hexagon(data)
-            utxo.move_to(data["pos"])
+            utxo.move_to(pos)
             utxos.add(utxo)
 
-        # Animate UTXOs appearing
-        for utxo in utxos:
-            self.play(
-                FadeIn(utxo, scale=0.3),
-                run_time=0.6
-            )
-            self.wait(0.2)
+        # Animate UTXOs appearing, staggered within one play call so the
+        # per-play scheduler and render-flush cost is paid once
+        self.play(
+            LaggedStart(
+                *[FadeIn(utxo, scale=0.3) for utxo in utxos],
+                lag_ratio=0.45
+            ),
+            run_time=2.0
+        )
 
-        self.wait(1)
+        self.wait(1 * WAIT_SCALE)
 
         # Explanation text
-        explain = Text(
+        explain = styled_text(
             "Alice wants to send 0.7 BTC to Bob",
             font_size=24,
             color=SYNTH_GREEN
         )
         explain.to_edge(DOWN).shift(UP * 0.5)
         self.play(Write(explain))
-        self.wait(1.5)
+        self.wait(1.5 * WAIT_SCALE)
 
         # Show coin selection label
-        coin_selection_label = Text(
+        coin_selection_label = styled_text(
             "Coin Selection",
             font_size=20,
             color=SYNTH_CYAN,
@@ -82,40 +224,48 @@ class TheWallet(Scene):
         )
         coin_selection_label.to_edge(DOWN).shift(UP * 2.2)
         self.play(FadeIn(coin_selection_label, shift=UP * 0.2))
-        self.wait(0.5)
+        self.wait(0.5 * WAIT_SCALE)
 
         # Show UTXO selection - highlight selected ones
-        selection_text = Text(
+        selection_text = styled_text(
             "Wallet selects: 0.5 + 0.35 = 0.85 BTC",
             font_size=24,
             color=SYNTH_ORANGE
         )
         selection_text.move_to(explain)
 
+        # Caption swaps cross-fade rather than Transform: morphing two
+        # unrelated glyph sets remaps every bezier point per frame, while
+        # a fade is a flat opacity tween
         self.play(
-            Transform(explain, selection_text),
+            FadeOut(explain),
+            FadeIn(selection_text),
             utxos[0].animate.set_stroke(color=SYNTH_ORANGE, width=2),
             utxos[1].animate.set_stroke(color=SYNTH_ORANGE, width=2),
             run_time=1.5
         )
+        explain = selection_text
 
-        # Pulse effect on selected UTXOs
-        for _ in range(2):
+        # Pulse effect on selected UTXOs. Both cycles run inside a single
+        # play call; four separate plays would each pay animation setup
+        # and a scene flush for a 0.4s beat. Indicate returns each hexagon
+        # to its starting size, so the pulse leaves no net scale behind.
+        # Purely decorative, so fast previews drop it outright.
+        if not VIZ_FAST:
             self.play(
-                utxos[0].animate.scale(1.1),
-                utxos[1].animate.scale(1.1),
-                run_time=0.4
-            )
-            self.play(
-                utxos[0].animate.scale(1/1.1),
-                utxos[1].animate.scale(1/1.1),
-                run_time=0.4
+                Succession(*[
+                    AnimationGroup(
+                        Indicate(utxos[0], scale_factor=1.1, color=SYNTH_ORANGE, run_time=0.8),
+                        Indicate(utxos[1], scale_factor=1.1, color=SYNTH_ORANGE, run_time=0.8),
+                    )
+                    for _ in range(2)
+                ])
             )
 
-        self.wait(0.5)
+        self.wait(0.5 * WAIT_SCALE)
 
         # Add change distribution note
-        change_text = Text(
+        change_text = styled_text(
             "Bob will receive 0.7 BTC and Alice will receive 0.14 BTC as change (0.01 BTC fee)",
             font_size=22,
             color=SYNTH_GREEN
@@ -127,21 +277,20 @@ class TheWallet(Scene):
             run_time=1
         )
 
-        self.wait(1.5)
+        self.wait(1.5 * WAIT_SCALE)
 
         # Fade out unselected UTXO and other elements
         self.play(
             FadeOut(utxos[2]),
-            FadeOut(grid),
-            FadeOut(wallet_label),
+            FadeOut(backdrop),
             FadeOut(coin_selection_label),
             run_time=1
         )
-        self.wait(0.5)
+        self.wait(0.5 * WAIT_SCALE)
 
         # === Transaction Structure Visualization ===
         # Transform the text to show we're consuming the UTXOs
-        consuming_text = Text(
+        consuming_text = styled_text(
             "Alice's 2 UTXOs are completely consumed",
             font_size=22,
             color=SYNTH_CYAN
@@ -149,11 +298,13 @@ class TheWallet(Scene):
         consuming_text.to_edge(DOWN).shift(UP * 0.5)
 
         self.play(
-            Transform(explain, consuming_text),
+            FadeOut(explain),
+            FadeIn(consuming_text),
             FadeOut(change_text),
             run_time=0.8
         )
-        self.wait(0.5)
+        explain = consuming_text
+        self.wait(0.5 * WAIT_SCALE)
 
         # Move selected UTXOs to the left side
         self.play(
@@ -161,13 +312,17 @@ class TheWallet(Scene):
             utxos[1].animate.move_to(LEFT * 4 + DOWN * 0.8).scale(0.7),
             run_time=1
         )
-        self.wait(0.3)
+        self.wait(0.3 * WAIT_SCALE)
 
         # Create central pool (glowing circle)
-        central_pool = Circle(radius=0.8, color=SYNTH_CYAN, stroke_width=3)
-        central_pool.set_fill(color=SYNTH_CYAN, opacity=0.2)
+        # Fill style goes in at construction; a follow-up set_fill would
+        # rewalk the mobject and invalidate its freshly built state
+        central_pool = Circle(
+            radius=0.8, color=SYNTH_CYAN, stroke_width=3,
+            fill_color=SYNTH_CYAN, fill_opacity=0.2
+        )
 
-        pool_label = Text("0.85 BTC", font_size=20, color=SYNTH_CYAN, weight=BOLD)
+        pool_label = styled_text("0.85 BTC", font_size=20, color=SYNTH_CYAN, weight=BOLD)
         pool_label.next_to(central_pool, UP, buff=0.3)
 
         pool_group = VGroup(central_pool, pool_label)
@@ -181,14 +336,33 @@ class TheWallet(Scene):
         particles1 = self.create_particles(utxos[0].get_center(), 15)
         particles2 = self.create_particles(utxos[1].get_center(), 15)
 
-        # Animate particles flowing from UTXOs to center
+        # Animate particles flowing from UTXOs to center. Jitter for all
+        # particles comes from one bulk RNG draw, and the motion is driven
+        # by a single alpha updater slicing precomputed start/target
+        # arrays — one per-frame callback instead of thirty independent
+        # animate builders each interpolating their own mobject copy.
+        pool_center = central_pool.get_center()
+        inflow = VGroup(*particles1, *particles2)
+        offsets = _RNG.uniform(-0.3, 0.3, size=(len(inflow), 3))
+        offsets[:, 2] = 0
+        gather_starts = np.array([particle.get_center() for particle in inflow])
+        gather_deltas = pool_center + offsets - gather_starts
+
+        # The frame positions are one broadcast; applying them adds the
+        # per-particle step straight into each points buffer (the dots are
+        # rigid, so this is equivalent to move_to without its about_point
+        # bookkeeping or a get_center walk per particle per frame)
+        gather_current = gather_starts.copy()
+
+        def gather(group, alpha):
+            frame_points = gather_starts + alpha * gather_deltas
+            steps = frame_points - gather_current
+            for particle, step in zip(group.submobjects, steps):
+                particle.points += step
+            gather_current[:] = frame_points
+
         self.play(
-            *[particle.animate.move_to(central_pool.get_center() +
-                np.array([np.random.uniform(-0.3, 0.3), np.random.uniform(-0.3, 0.3), 0]))
-                for particle in particles1],
-            *[particle.animate.move_to(central_pool.get_center() +
-                np.array([np.random.uniform(-0.3, 0.3), np.random.uniform(-0.3, 0.3), 0]))
-                for particle in particles2],
+            UpdateFromAlphaFunc(inflow, gather),
             FadeOut(utxos[0]),
             FadeOut(utxos[1]),
             run_time=1.5
@@ -204,7 +378,7 @@ class TheWallet(Scene):
             central_pool.animate.set_fill(opacity=0.15),
             run_time=0.5
         )
-        self.wait(0.5)
+        self.wait(0.5 * WAIT_SCALE)
 
         # Create output boxes on the right
         output1_box = self.create_output_box("0.7 BTC", "(to Bob)", SYNTH_ORANGE)
@@ -219,22 +393,36 @@ class TheWallet(Scene):
         fee_box[0].set_stroke(opacity=0.6)  # More ephemeral border
         fee_box[1].set_opacity(0.7)  # More ephemeral text
 
-        # Split particles and flow to outputs (proportional to value)
-        # Total 30 particles: ~21 to Bob, ~4 to change, ~5 to fees
-        particles_to_output1 = particles1[:11] + particles2[:10]  # 21 particles for 0.7 BTC
-        particles_to_output2 = particles1[11:13] + particles2[10:12]  # 4 particles for 0.14 BTC
-        particles_to_fee = particles1[13:] + particles2[12:]  # 5 particles for 0.01 BTC
+        # Split particles and flow to outputs (proportional to value):
+        # 21 to Bob, 4 to change, 5 to fees. The full (30, 3) target
+        # array is assembled in one pass — box centers repeated per
+        # split plus a single bulk jitter draw — and consumed by one
+        # alpha updater
+        outflow = VGroup(*particles1, *particles2)
+        split_counts = (21, 4, 5)
+        box_centers = np.array([
+            output1_box.get_center(),
+            output2_box.get_center(),
+            fee_box.get_center(),
+        ])
+        jitter = _RNG.uniform(
+            (-0.4, -0.3, 0), (0.4, 0.3, 0), size=(len(outflow), 3)
+        )
+        targets = np.repeat(box_centers, split_counts, axis=0) + jitter
+
+        scatter_starts = np.array([particle.get_center() for particle in outflow])
+        scatter_deltas = targets - scatter_starts
+        scatter_current = scatter_starts.copy()
+
+        def scatter(group, alpha):
+            frame_points = scatter_starts + alpha * scatter_deltas
+            steps = frame_points - scatter_current
+            for particle, step in zip(group.submobjects, steps):
+                particle.points += step
+            scatter_current[:] = frame_points
 
         self.play(
-            *[particle.animate.move_to(output1_box.get_center() +
-                np.array([np.random.uniform(-0.4, 0.4), np.random.uniform(-0.3, 0.3), 0]))
-                for particle in particles_to_output1],
-            *[particle.animate.move_to(output2_box.get_center() +
-                np.array([np.random.uniform(-0.4, 0.4), np.random.uniform(-0.3, 0.3), 0]))
-                for particle in particles_to_output2],
-            *[particle.animate.move_to(fee_box.get_center() +
-                np.array([np.random.uniform(-0.4, 0.4), np.random.uniform(-0.3, 0.3), 0]))
-                for particle in particles_to_fee],
+            UpdateFromAlphaFunc(outflow, scatter),
             FadeOut(pool_label),
             central_pool.animate.set_fill(opacity=0.05),
             run_time=1.5
@@ -250,12 +438,12 @@ class TheWallet(Scene):
         )
 
         # Show caption about creating new UTXOs and fees
-        creating_line1 = Text(
+        creating_line1 = styled_text(
             "...creating 2 new UTXOs: 0.7 BTC (for Bob) and 0.14 BTC (change)",
             font_size=20,
             color=SYNTH_GREEN
         )
-        creating_line2 = Text(
+        creating_line2 = styled_text(
             "and contributing 0.01 BTC in fees to the block reward",
             font_size=20,
             color=SYNTH_GREEN
@@ -265,10 +453,12 @@ class TheWallet(Scene):
         creating_text.to_edge(DOWN).shift(UP * 0.5)
 
         self.play(
-            Transform(explain, creating_text),
+            FadeOut(explain),
+            FadeIn(creating_text),
             run_time=1
         )
-        self.wait(1.5)
+        explain = creating_text
+        self.wait(1.5 * WAIT_SCALE)
 
         # Recreate input boxes to show final transaction structure
         input1_box = self.create_output_box("0.5 BTC", "", SYNTH_GREEN)
@@ -284,16 +474,16 @@ class TheWallet(Scene):
             run_time=0.8
         )
 
-        self.wait(0.3)
+        self.wait(0.3 * WAIT_SCALE)
 
         # Add "Inputs", "Outputs", and "Fees" labels
-        inputs_label = Text("Inputs", font_size=20, color=SYNTH_GREEN, weight=BOLD)
+        inputs_label = styled_text("Inputs", font_size=20, color=SYNTH_GREEN, weight=BOLD)
         inputs_label.move_to(LEFT * 4 + UP * 2.5)
 
-        outputs_label = Text("Outputs", font_size=20, color=SYNTH_ORANGE, weight=BOLD)
+        outputs_label = styled_text("Outputs", font_size=20, color=SYNTH_ORANGE, weight=BOLD)
         outputs_label.move_to(RIGHT * 4 + UP * 2.5)
 
-        fees_label = Text("Fees", font_size=20, color=SYNTH_GOLD, weight=BOLD)
+        fees_label = styled_text("Fees", font_size=20, color=SYNTH_GOLD, weight=BOLD)
         fees_label.next_to(fee_box, LEFT, buff=0.5)
 
         self.play(
@@ -303,10 +493,10 @@ class TheWallet(Scene):
             run_time=0.8
         )
 
-        self.wait(0.5)
+        self.wait(0.5 * WAIT_SCALE)
 
         # Final summary
-        final_text = Text(
+        final_text = styled_text(
             "Transaction: 0.85 BTC in → 0.84 BTC out + 0.01 BTC fee",
             font_size=22,
             color=SYNTH_GREEN
@@ -314,103 +504,78 @@ class TheWallet(Scene):
         final_text.to_edge(DOWN).shift(UP * 0.5)
 
         self.play(
-            Transform(explain, final_text),
+            FadeOut(explain),
+            FadeIn(final_text),
             run_time=1
         )
 
-        self.wait(2)
+        self.wait(2 * WAIT_SCALE)
 
     def create_particles(self, center_pos, count):
         """Create small particle dots for flow animation"""
-        particles = VGroup()
-        for _ in range(count):
-            # Create small glowing dots
-            dot = Dot(
-                point=center_pos + np.array([
-                    np.random.uniform(-0.3, 0.3),
-                    np.random.uniform(-0.3, 0.3),
-                    0
-                ]),
-                radius=0.05,
-                color=SYNTH_CYAN
-            )
-            dot.set_fill(color=SYNTH_CYAN, opacity=0.8)
-            particles.add(dot)
-            self.add(dot)
+        # All scatter positions come from a single RNG draw, and every
+        # particle is a copy of one fill-only prototype: at ~5px on
+        # screen the dots carry no stroke, so Cairo rasterizes a plain
+        # fill per particle with no second stroke/AA pass
+        points = center_pos + np.concatenate(
+            [_RNG.uniform(-0.3, 0.3, (count, 2)), np.zeros((count, 1))],
+            axis=1
+        )
+        proto = Dot(radius=0.05, color=SYNTH_CYAN, fill_opacity=0.8, stroke_width=0)
+        particles = VGroup(*[proto.copy().move_to(point) for point in points])
+        self.add(particles)
         return particles
 
     def create_output_box(self, amount, label, color):
         """Create an output box with amount and label"""
-        amount_text = Text(amount, font_size=20, color=color, weight=BOLD)
-        label_text = Text(label, font_size=14, color=color)
+        amount_text = styled_text(amount, font_size=20, color=color, weight=BOLD)
+        label_text = styled_text(label, font_size=14, color=color)
         label_text.set_opacity(0.8)
 
         text_group = VGroup(amount_text, label_text).arrange(DOWN, buff=0.1)
 
-        # Box around text
-        box = SurroundingRectangle(
-            text_group,
+        # Box around text, sized from the measured extents instead of
+        # SurroundingRectangle's bounding-box sweep (and served from the
+        # shared rounded-rect geometry cache)
+        box = rounded_rect(
+            text_group.width + 0.4,
+            text_group.height + 0.4,
+            corner_radius=0.1,
             color=color,
-            stroke_width=2,
-            buff=0.2,
-            corner_radius=0.1
+            fill_opacity=0.15,
+            stroke_width=2
         )
-        box.set_fill(color=color, opacity=0.15)
+        box.move_to(text_group)
 
         return VGroup(box, text_group)
 
     def create_utxo_hexagon(self, data):
         """Create a hexagonal UTXO with data labels (larger size)"""
         # Hexagon shape (increased radius from 0.8 to 1.1 for more space)
-        hexagon = RegularPolygon(n=6, radius=1.1, color=SYNTH_GREEN, stroke_width=2)
-        hexagon.set_fill(color=SYNTH_GREEN, opacity=0.1)
+        hexagon = _UTXO_HEX_PROTO.copy()
 
         # Amount label (large, centered)
-        amount = Text(data["amount"], font_size=24, color=SYNTH_GREEN, weight=BOLD)
+        amount = styled_text(data["amount"], font_size=24, color=SYNTH_GREEN, weight=BOLD)
 
         # Transaction details (smaller, below)
-        txid = Text(data["txid"], font_size=12, color=SYNTH_CYAN)
-        output = Text(f"output {data['output']}", font_size=12, color=SYNTH_CYAN)
+        txid = styled_text(data["txid"], font_size=12, color=SYNTH_CYAN)
+        output = styled_text(f"output {data['output']}", font_size=12, color=SYNTH_CYAN)
 
-        details = VGroup(txid, output).arrange(DOWN, buff=0.05)
-        details.scale(0.8)
+        # Stack the labels with direct next_to offsets instead of two
+        # nested arrange passes (each arrange re-measures every child)
+        txid.scale(0.8)
+        output.scale(0.8)
+        txid.next_to(amount, DOWN, buff=0.15)
+        output.next_to(txid, DOWN, buff=0.04)
 
-        # Arrange everything
-        labels = VGroup(amount, details).arrange(DOWN, buff=0.15)
+        labels = VGroup(amount, txid, output)
         labels.move_to(hexagon)
 
         return VGroup(hexagon, labels)
 
     def create_synthwave_grid(self):
         """Create a synthwave-style perspective grid background"""
-        grid = VGroup()
-
-        # Horizontal lines (perspective)
-        for i in range(-5, 2):
-            y = i * 0.8
-            scale = 1 + (i + 5) * 0.1  # Perspective effect
-            line = Line(
-                LEFT * 7 * scale + UP * y,
-                RIGHT * 7 * scale + UP * y,
-                stroke_width=1,
-                color=SYNTH_PURPLE,
-                stroke_opacity=0.3
-            )
-            grid.add(line)
-
-        # Vertical lines
-        for i in range(-6, 7):
-            line = Line(
-                UP * 1.5 + RIGHT * i,
-                DOWN * 4 + RIGHT * i * 1.5,
-                stroke_width=1,
-                color=SYNTH_PURPLE,
-                stroke_opacity=0.3
-            )
-            grid.add(line)
-
-        grid.shift(DOWN * 2)
-        return grid
+        return _GRID_TEMPLATE.copy()
 
 
 class TransactionConstruction(Scene):
@@ -423,10 +588,10 @@ class TransactionConstruction(Scene):
         self.camera.background_color = SYNTH_BG
 
         # Scene title (no "Act" label)
-        title = Text("Transaction Construction", font_size=38, color=SYNTH_CYAN)
+        title = title_text("Transaction Construction")
         title.to_edge(UP)
         self.play(Write(title))
-        self.wait(0.5)
+        self.wait(0.5 * WAIT_SCALE)
 
         # Create central transaction packet - crystalline hexagonal structure
         packet_center = self.create_transaction_packet()
@@ -443,31 +608,38 @@ class TransactionConstruction(Scene):
             run_time=1
         )
 
-        self.wait(0.5)
+        self.wait(0.5 * WAIT_SCALE)
 
         # Show packet components appearing in layers
         # Inputs: 0.5 + 0.35 = 0.85 BTC
         # Outputs: 0.7 to Bob + 0.1 change to Alice = 0.8 BTC
         # Fee: 0.85 - 0.8 = 0.05 BTC
         components = [
-            {"label": "Header", "sublabel": "version, locktime", "color": SYNTH_CYAN, "pos": UP * 2.5},
-            {"label": "Inputs", "sublabel": "0.5 + 0.35 BTC UTXOs", "color": SYNTH_GREEN, "pos": UP * 1},
-            {"label": "Outputs", "sublabel": "0.7 → Bob, 0.1 → Alice", "color": SYNTH_ORANGE, "pos": DOWN * 0.5},
-            {"label": "Fee", "sublabel": "0.05 BTC to miners", "color": SYNTH_PEACH, "pos": DOWN * 2},
+            {"label": "Header", "sublabel": "version, locktime", "color": SYNTH_CYAN},
+            {"label": "Inputs", "sublabel": "0.5 + 0.35 BTC UTXOs", "color": SYNTH_GREEN},
+            {"label": "Outputs", "sublabel": "0.7 → Bob, 0.1 → Alice", "color": SYNTH_ORANGE},
+            {"label": "Fee", "sublabel": "0.05 BTC to miners", "color": SYNTH_PEACH},
         ]
+        # Evenly spaced label rows, derived in one vectorized expression
+        # instead of a hand-maintained vector per component
+        component_ys = 2.5 - 1.5 * np.arange(len(components))
+
+        # Resolve the packet's right edge once; get_right() walks the whole
+        # points array and the anchor does not move during this loop
+        packet_right = packet_center.get_right()
 
         component_labels = VGroup()
-        for comp in components:
+        for comp, label_y in zip(components, component_ys):
             label_group = self.create_component_label(
                 comp["label"],
                 comp["sublabel"],
                 comp["color"]
             )
-            label_group.next_to(packet_center, RIGHT, buff=1.5).shift(comp["pos"] - UP * 0.5)
+            label_group.next_to(packet_center, RIGHT, buff=1.5).shift(UP * (label_y - 0.5))
 
             # Arrow from packet to label
             arrow = Arrow(
-                packet_center.get_right(),
+                packet_right,
                 label_group.get_left(),
                 color=comp["color"],
                 buff=0.1,
@@ -477,19 +649,27 @@ class TransactionConstruction(Scene):
 
             component_labels.add(VGroup(arrow, label_group))
 
-        # Animate each component appearing
-        for comp_group in component_labels:
-            self.play(
-                GrowArrow(comp_group[0]),
-                FadeIn(comp_group[1], shift=LEFT * 0.3),
-                run_time=0.7
-            )
-            self.wait(0.3)
+        # Animate each component appearing. One staggered play keeps the
+        # sequential reveal while paying play-call setup once instead of
+        # once per component
+        self.play(
+            LaggedStart(
+                *[
+                    AnimationGroup(
+                        GrowArrow(comp_group[0]),
+                        FadeIn(comp_group[1], shift=LEFT * 0.3)
+                    )
+                    for comp_group in component_labels
+                ],
+                lag_ratio=0.4
+            ),
+            run_time=3
+        )
 
-        self.wait(1)
+        self.wait(1 * WAIT_SCALE)
 
         # Highlight scriptPubKey (locking script)
-        script_text = Text(
+        script_text = styled_text(
             "scriptPubKey: Locking scripts on outputs",
             font_size=20,
             color=SYNTH_ORANGE
@@ -502,10 +682,10 @@ class TransactionConstruction(Scene):
 
         self.play(Write(script_text))
         self.play(Create(circuit), run_time=1.5)
-        self.wait(1)
+        self.wait(1 * WAIT_SCALE)
 
         # Signature generation effect
-        sig_text = Text(
+        sig_text = styled_text(
             "scriptSig: Alice's signatures unlock inputs",
             font_size=20,
             color=SYNTH_PURPLE
@@ -517,14 +697,16 @@ class TransactionConstruction(Scene):
         lightning.move_to(packet_center)
 
         self.play(
-            Transform(script_text, sig_text),
+            FadeOut(script_text),
+            FadeIn(sig_text),
             FadeOut(circuit)
         )
+        script_text = sig_text
         self.play(Create(lightning), run_time=0.8)
-        self.wait(0.5)
+        self.wait(0.5 * WAIT_SCALE)
 
         # Transaction ready (changed from "sealed")
-        ready_text = Text(
+        ready_text = styled_text(
             "Transaction signed and ready to broadcast",
             font_size=24,
             color=SYNTH_GREEN,
@@ -533,96 +715,53 @@ class TransactionConstruction(Scene):
         ready_text.move_to(script_text)
 
         self.play(
-            Transform(script_text, ready_text),
+            FadeOut(script_text),
+            FadeIn(ready_text),
             FadeOut(lightning),
             packet_center.animate.set_stroke(color=SYNTH_GREEN, width=4),
             run_time=1
         )
 
-        # Intense glow effect
-        self.play(
-            packet_center.animate.set_fill(opacity=0.4),
-            run_time=0.5
-        )
-        self.play(
-            packet_center.animate.set_fill(opacity=0.2),
-            run_time=0.5
-        )
+        # Intense glow effect, both halves chained in one play call
+        # (decorative: skipped in fast previews)
+        if not VIZ_FAST:
+            self.play(
+                Succession(
+                    packet_center.animate(run_time=0.5).set_fill(opacity=0.4),
+                    packet_center.animate(run_time=0.5).set_fill(opacity=0.2),
+                )
+            )
 
-        self.wait(2)
+        self.wait(2 * WAIT_SCALE)
 
     def create_transaction_packet(self):
         """Create a crystalline hexagonal packet structure"""
-        # Central hexagon
-        center = RegularPolygon(n=6, radius=1, color=SYNTH_GREEN, stroke_width=3)
-        center.set_fill(color=SYNTH_GREEN, opacity=0.15)
-
-        # Surrounding hexagons
-        surrounding = VGroup()
-        for i in range(6):
-            angle = i * PI / 3
-            hex = RegularPolygon(n=6, radius=0.5, color=SYNTH_CYAN, stroke_width=2)
-            hex.set_fill(color=SYNTH_CYAN, opacity=0.1)
-            hex.move_to(center.get_center() + np.array([np.cos(angle), np.sin(angle), 0]) * 1.2)
-            surrounding.add(hex)
-
-        # Connection lines
-        connections = VGroup()
-        for hex in surrounding:
-            line = Line(
-                center.get_center(),
-                hex.get_center(),
-                color=SYNTH_GREEN,
-                stroke_width=1,
-                stroke_opacity=0.5
-            )
-            connections.add(line)
-
-        return VGroup(connections, center, surrounding)
+        return _PACKET_TEMPLATE.copy()
 
     def create_component_label(self, label, sublabel, color):
         """Create a label with sublabel for transaction components"""
-        main = Text(label, font_size=22, color=color, weight=BOLD)
-        sub = Text(sublabel, font_size=14, color=color)
+        main = styled_text(label, font_size=22, color=color, weight=BOLD)
+        sub = styled_text(sublabel, font_size=14, color=color)
         sub.set_opacity(0.7)
 
         group = VGroup(main, sub).arrange(DOWN, buff=0.1, aligned_edge=LEFT)
 
-        # Background box
-        box = SurroundingRectangle(
-            group,
+        # Background box sized directly from the arranged extents
+        box = rounded_rect(
+            group.width + 0.3,
+            group.height + 0.3,
+            corner_radius=0.05,
             color=color,
-            stroke_width=1,
-            buff=0.15,
-            corner_radius=0.05
+            fill_opacity=0.1,
+            stroke_width=1
         )
-        box.set_fill(color=color, opacity=0.1)
+        box.move_to(group)
 
         return VGroup(box, group)
 
     def create_circuit_pattern(self):
         """Create a circuit-like pattern for scriptPubKey visualization"""
-        circuit = VGroup()
-
-        # Create some circuit-like paths
-        for i in range(3):
-            path = VMobject(color=SYNTH_ORANGE, stroke_width=2)
-            path.set_points_as_corners([
-                LEFT * 2 + UP * (i - 1) * 0.3,
-                LEFT * 1 + UP * (i - 1) * 0.3,
-                LEFT * 1 + UP * ((i - 1) * 0.3 + 0.2),
-                RIGHT * 1 + UP * ((i - 1) * 0.3 + 0.2),
-                RIGHT * 1 + UP * (i - 1) * 0.3,
-                RIGHT * 2 + UP * (i - 1) * 0.3,
-            ])
-            circuit.add(path)
-
-            # Add small circles at corners
-            for j in [1, 2, 3, 4]:
-                dot = Dot(path.get_points()[j], radius=0.05, color=SYNTH_ORANGE)
-                circuit.add(dot)
-
-        return circuit
+        return _CIRCUIT_TEMPLATE.copy()
 
     def create_signature_lightning(self):
         """Create lightning effect for signature visualization"""
@@ -640,9 +779,25 @@ class TransactionConstruction(Scene):
                 np.array([np.cos(angle) * 1.0, np.sin(angle) * 1.0, 0]),
             ]
 
-            bolt = VMobject(color=SYNTH_PURPLE, stroke_width=3)
+            bolt = VMobject(color=SYNTH_PURPLE, stroke_width=3, stroke_opacity=0.8)
             bolt.set_points_as_corners(points)
-            bolt.set_stroke(opacity=0.8)
             lightning.add(bolt)
 
         return lightning
+
+
+if __name__ == "__main__":
+    # Render this act's scenes in parallel. manim is single-threaded per
+    # scene (Cairo + the GIL), but the scenes are independent processes
+    # apart, so wall-clock time drops to roughly the slowest scene.
+    # Usage: python animations/transaction_lifecycle/act1_creation.py [ql|qm|qh|qk]
+    import subprocess
+    from concurrent.futures import ProcessPoolExecutor
+
+    quality = sys.argv[1] if len(sys.argv) > 1 else "ql"
+    scenes = ("TheWallet", "TransactionConstruction")
+    with ProcessPoolExecutor(max_workers=len(scenes)) as pool:
+        list(pool.map(
+            subprocess.run,
+            [["manim", f"-{quality}", __file__, scene] for scene in scenes]
+        ))
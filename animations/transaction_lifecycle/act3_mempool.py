@@ -148,15 +148,10 @@ class MempoolWaiting(Scene):
         network_text.move_to(explain)
 
         # Small network visualization in corner
-        mini_network = VGroup()
-        for i in range(8):
-            angle = i * TAU / 8
-            dot = Dot(
-                radius=0.08,
-                color=SYNTH_CYAN,
-                point=np.array([np.cos(angle), np.sin(angle), 0.0]) * 0.8
-            )
-            mini_network.add(dot)
+        mini_network = VGroup(*[
+            Dot(radius=0.08, color=SYNTH_CYAN, point=pos)
+            for pos in ring_positions(8, radius=0.8)
+        ])
 
         mini_network.scale(0.6).to_corner(DR).shift(LEFT * 0.5 + UP * 1)
 
@@ -166,14 +161,12 @@ class MempoolWaiting(Scene):
             run_time=0.8
         )
 
-        # Pulse effect on mini network
-        self.play(
-            *[dot.animate.set_color(SYNTH_GREEN).scale(1.3) for dot in mini_network],
-            run_time=0.4
-        )
+        # Pulse effect on mini network: Indicate folds the scale-up,
+        # highlight and scale-back into one group animation instead of
+        # paired per-dot scale/unscale plays
         self.play(
-            *[dot.animate.scale(1/1.3) for dot in mini_network],
-            run_time=0.4
+            Indicate(mini_network, scale_factor=1.3, color=SYNTH_GREEN),
+            run_time=0.8
         )
 
         self.wait(2)
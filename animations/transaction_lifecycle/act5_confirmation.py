@@ -57,16 +57,12 @@ class BlockPropagation(Scene):
 
         self.wait(0.5)
 
-        # Network nodes
-        network_nodes = VGroup()
-        for i in range(12):
-            angle = i * TAU / 12
-            node = Dot(
-                radius=0.15,
-                color=SYNTH_CYAN,
-                point=np.array([np.cos(angle) * 3, np.sin(angle) * 2, 0.0]) + RIGHT * 2
-            )
-            network_nodes.add(node)
+        # Network nodes (elliptical ring, offset right)
+        node_positions = ring_positions(12) * np.array([3.0, 2.0, 1.0]) + RIGHT * 2
+        network_nodes = VGroup(*[
+            Dot(radius=0.15, color=SYNTH_CYAN, point=pos)
+            for pos in node_positions
+        ])
 
         self.play(
             *[GrowFromCenter(node) for node in network_nodes],
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Render every transaction lifecycle scene in parallel.
+
+manim is single-threaded per scene (Cairo rasterization plus the GIL),
+but the lifecycle scenes are independent and each writes its own output
+file, so they fan out cleanly across processes. Wall-clock time drops
+to roughly the slowest scene instead of the sum of all nine.
+
+Usage (from the repo root, with the venv active):
+
+    python scripts/render_all.py [ql|qm|qh|qk]
+"""
+
+import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# Mirrors the scene list in `just render-lifecycle`
+SCENES = (
+    ("animations/transaction_lifecycle/act1_creation.py", "TheWallet"),
+    ("animations/transaction_lifecycle/act1_creation.py", "TransactionConstruction"),
+    ("animations/transaction_lifecycle/act2_propagation.py", "InitialBroadcast"),
+    ("animations/transaction_lifecycle/act2_propagation.py", "NodeValidation"),
+    ("animations/transaction_lifecycle/act3_mempool.py", "MempoolWaiting"),
+    ("animations/transaction_lifecycle/act4_mining.py", "BlockTemplate"),
+    ("animations/transaction_lifecycle/act4_mining.py", "Mining"),
+    ("animations/transaction_lifecycle/act5_confirmation.py", "BlockPropagation"),
+    ("animations/transaction_lifecycle/act5_confirmation.py", "ChainExtension"),
+)
+
+
+def render(args):
+    file, scene, quality = args
+    return subprocess.run(["manim", f"-{quality}", file, scene]).returncode
+
+
+def main():
+    quality = sys.argv[1] if len(sys.argv) > 1 else "ql"
+    # Each manim process is mildly multi-threaded itself, so half the
+    # cores keeps the machine responsive without leaving it idle
+    workers = max(os.cpu_count() // 2, 1)
+    jobs = [(file, scene, quality) for file, scene in SCENES]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        codes = list(pool.map(render, jobs))
+    failed = [SCENES[i] for i, code in enumerate(codes) if code != 0]
+    for file, scene in failed:
+        print(f"FAILED: {file} {scene}", file=sys.stderr)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()